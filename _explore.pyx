@@ -0,0 +1,53 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled version of the search in explore.py.
+
+It takes the same CSR neighbours as explore.reachable() and returns
+the same list, but the search runs in C. Build it with
+
+    cythonize -i _explore.pyx
+
+and explore.py will pick it up.
+"""
+
+import numpy as np
+
+
+def reachable(int a, indptr, indices) -> list[int]:
+    """Collect all cities reachable from `a`."""
+    ptr_ = np.ascontiguousarray(indptr, dtype=np.int32)
+    idx_ = np.ascontiguousarray(indices, dtype=np.int32)
+    cdef Py_ssize_t n = len(ptr_) - 1
+
+    # the search runs without bounds checks, so check what it relies on:
+    # indptr runs from 0 to len(indices) without decreasing, and all the
+    # neighbours are nodes
+    if n < 0 or ptr_[0] != 0 or ptr_[n] != len(idx_) \
+            or np.any(np.diff(ptr_) < 0) \
+            or np.any((idx_ < 0) | (idx_ >= n)):
+        raise ValueError("indptr and indices are not a valid CSR pair")
+    if not 0 <= a < n:
+        raise IndexError(f"node {a} is not in the range 0 <= ... < {n}")
+
+    seen_ = np.zeros(n, dtype=np.uint8)
+    queue_ = np.empty(n, dtype=np.int32)
+    cdef int[::1] ptr = ptr_
+    cdef int[::1] idx = idx_
+    cdef unsigned char[::1] seen = seen_
+    cdef int[::1] queue = queue_
+    cdef Py_ssize_t head = 0, tail = 1, k
+    cdef int v, w
+
+    seen[a] = 1
+    queue[0] = a
+    with nogil:
+        while head < tail:
+            v = queue[head]  # process the next city
+            head += 1
+            for k in range(ptr[v], ptr[v + 1]):
+                w = idx[k]
+                if not seen[w]:
+                    seen[w] = 1
+                    queue[tail] = w
+                    tail += 1
+    return np.flatnonzero(seen_).tolist()
@@ -7,51 +7,40 @@ or size (number of nodes in a tree) and either will balance the trees
 to O(log k) for trees of size/rank k. (This isn't a general case for
 trees of size k, but it is when we build them by making the smaller tree
 a subtree of the larger).
-"""
-
-
-def is_size(v: int) -> bool:
-    """Check if v is size."""
-    return v < 0
-
-
-def is_node(v: int) -> bool:
-    """Check if v is a node."""
-    return v >= 0
 
+We balance by rank here. Roots point to themselves, and the parent
+and rank of node v sit next to each other, at f[2 * v] and
+f[2 * v + 1], so looking at a node only touches one place in memory.
+"""
 
-def size(v: int) -> int:
-    """Cast sizes to integers."""
-    assert is_size(v)
-    return -v
-
+from array import array
 
-def to_size(v: int) -> int:
-    """Cast integers to sizes."""
-    return -v
+Forest = array
 
 
-def root(f: list[int], v: int) -> int:
+def root(f: Forest, v: int) -> int:
     """Locate the root of v's forest."""
-    while is_node(f[v]):
-        v = f[v]
+    parent = f[2 * v]
+    while parent != v:
+        v, parent = parent, f[2 * parent]
     return v
 
 
-def union(f: list[int], v: int, w: int) -> None:
+def union(f: Forest, v: int, w: int) -> None:
     """Merge v's and w's components and update comp accordingly."""
     root_v, root_w = root(f, v), root(f, w)
-    size_w, size_v = size(f[root_w]), size(f[root_v])
-    new_size = to_size(size_w + size_v)
+    if root_v == root_w:
+        return
 
-    # make the larger tree the root
-    if size_w < size_v:
+    # make the higher ranked tree the root
+    if f[2 * root_w + 1] < f[2 * root_v + 1]:
         root_v, root_w = root_w, root_v
-    f[root_v] = root_w
-    f[root_w] = new_size
+    f[2 * root_v] = root_w
+    if f[2 * root_v + 1] == f[2 * root_w + 1]:
+        f[2 * root_w + 1] += 1
 
 
-def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
+def components(n: int, edges: list[tuple[int, int]]) -> Forest:
     """
     Compute connected components.
 
@@ -65,11 +54,19 @@ def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
     >>> assert root(comp, 3) == root(comp, 4)
     >>> assert root(comp, 0) != root(comp, 3)
     """
-    components = [to_size(1) for i in range(n)]
+    components = array('i', [0]) * (2 * n)
+    components[0::2] = array('i', range(n))
     for v, w in edges:
         assert 0 <= v < n and 0 <= w < n
         union(components, v, w)
     return components
 
 
+try:
+    # use the compiled version from _unionfind.pyx if it is built
+    from _unionfind import components  # noqa: F811
+except ImportError:
+    pass
+
+
 print(components(5, [(0, 1), (2, 1), (3, 4)]))
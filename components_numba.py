@@ -0,0 +1,186 @@
+"""
+Building connected components with a compiled union-find kernel.
+
+This is the same algorithm as in balance.py and contract.py, but the
+forest is a numpy int32 array and the loops are compiled with Numba,
+so we don't pay the interpreter's overhead for each pointer we chase.
+
+Roots point to themselves, parent[v] == v, rather than holding a
+negative size, so the root search doesn't need to check signs. The
+ranks, used for balancing, live in a separate byte array since we
+read them far less often than the parent pointers.
+"""
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+
+@njit(cache=True)
+def find(parent: np.ndarray, x: int) -> int:
+    """Locate the root of x's tree, halving the path as we go."""
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+@njit(cache=True)
+def union(parent: np.ndarray, rank: np.ndarray, v: int, w: int) -> None:
+    """Merge v's and w's components and update comp accordingly."""
+    root_v, root_w = find(parent, v), find(parent, w)
+    if root_v == root_w:
+        return
+    # make the higher ranked tree the root
+    if rank[root_w] < rank[root_v]:
+        root_v, root_w = root_w, root_v
+    parent[root_v] = root_w
+    if rank[root_v] == rank[root_w]:
+        rank[root_w] += 1
+
+
+@njit(cache=True)
+def build(n: int, edges: np.ndarray) -> np.ndarray:
+    """Build the forest for n nodes from an (m, 2) array of edges."""
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.uint8)
+    for i in range(edges.shape[0]):
+        union(parent, rank, edges[i, 0], edges[i, 1])
+    return parent
+
+
+@njit(cache=True, parallel=True)
+def build_parallel(n: int, edges: np.ndarray, chunks: int) -> np.ndarray:
+    """
+    Build the forest for n nodes from an (m, 2) array of edges.
+
+    The edges are split into chunks that are handled in parallel, each
+    with its own forest. Each link in those forests connects two nodes
+    in the same component, so we get the final forest by replaying the
+    links, node by node, into a single forest.
+    """
+    if chunks < 1:
+        raise ValueError("chunks must be at least 1")
+    m = edges.shape[0]
+    parents = np.empty((chunks, n), dtype=np.int32)
+    ranks = np.zeros((chunks, n), dtype=np.uint8)
+    for c in prange(chunks):
+        parents[c] = np.arange(n, dtype=np.int32)
+        for i in range(c * m // chunks, (c + 1) * m // chunks):
+            union(parents[c], ranks[c], edges[i, 0], edges[i, 1])
+
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.uint8)
+    for c in range(chunks):
+        for v in range(n):
+            if parents[c, v] != v:
+                union(parent, rank, v, parents[c, v])
+    return parent
+
+
+def components(n: int, edges: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Compute connected components.
+
+    Compute the connected components for n nodes based on the
+    edges. All the nodes listed in the edges must be values in
+    the range 0 <= ... < n.
+
+    >>> comp = components(5, [(0, 1), (2, 1), (3, 4)])
+    >>> assert find(comp, 0) == find(comp, 1)
+    >>> assert find(comp, 1) == find(comp, 2)
+    >>> assert find(comp, 3) == find(comp, 4)
+    >>> assert find(comp, 0) != find(comp, 3)
+    """
+    edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    assert np.all((0 <= edges) & (edges < n))
+    return build(n, edges)
+
+
+def components_labels(n: int, edges: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Compute connected components as a label for each node.
+
+    Like components(), but after the forest is built every node is
+    pointed directly at its root, so labels[v] is the root of v's tree
+    and we never need to call find() afterwards. The pointer jumping,
+    parent = parent[parent], is done on the whole array at a time and
+    needs O(log n) passes at most.
+
+    >>> comp = components_labels(5, [(0, 1), (2, 1), (3, 4)])
+    >>> assert comp[0] == comp[1] and comp[1] == comp[2]
+    >>> assert comp[3] == comp[4]
+    >>> assert comp[0] != comp[3]
+    """
+    parent = components(n, edges)
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def components_parallel(
+    n: int,
+    edges: list[tuple[int, int]],
+    chunks: int | None = None
+) -> np.ndarray:
+    """
+    Compute connected components using several threads.
+
+    Works as components(), but splits the edges into chunks, one per
+    thread unless chunks says otherwise, and builds a forest for each
+    in parallel before merging them. The merge takes O(n) per chunk, so
+    this only pays off when there are many more edges than nodes.
+
+    >>> comp = components_parallel(5, [(0, 1), (2, 1), (3, 4)], chunks=2)
+    >>> assert find(comp, 0) == find(comp, 1)
+    >>> assert find(comp, 1) == find(comp, 2)
+    >>> assert find(comp, 3) == find(comp, 4)
+    >>> assert find(comp, 0) != find(comp, 3)
+    """
+    if chunks is None:
+        chunks = get_num_threads()
+    edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    assert np.all((0 <= edges) & (edges < n))
+    # there is no point in more chunks, and more forests, than edges
+    chunks = min(chunks, max(len(edges), 1))
+    return build_parallel(n, edges, chunks)
+
+
+def bfs_layout(parent: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Renumber the nodes of a forest so each tree is stored in BFS order.
+
+    Each tree gets a contiguous block of the array with its root first,
+    then the nodes at depth one, then depth two, and so on, so a search
+    for a root moves towards the start of the block rather than jumping
+    around in memory. This only pays off if the forest is queried many
+    times after it is built.
+
+    Returns (perm, new_parent), where node v of the old forest is node
+    perm[v] in new_parent.
+
+    >>> comp = components(5, [(0, 1), (2, 1), (3, 4)])
+    >>> perm, new = bfs_layout(comp)
+    >>> assert find(new, perm[0]) == find(new, perm[1])
+    >>> assert find(new, perm[1]) == find(new, perm[2])
+    >>> assert find(new, perm[3]) == find(new, perm[4])
+    >>> assert find(new, perm[0]) != find(new, perm[3])
+    """
+    n = len(parent)
+
+    # find the root and depth of every node by pointer jumping
+    root = parent.copy()
+    depth = (root != np.arange(n)).astype(np.int32)
+    while True:
+        grandparent = root[root]
+        if np.array_equal(grandparent, root):
+            break
+        depth += depth[root]
+        root = grandparent
+
+    # order the nodes by tree, and by depth within each tree
+    order = np.lexsort((depth, root))
+    perm = np.empty(n, dtype=np.int32)
+    perm[order] = np.arange(n, dtype=np.int32)
+    return perm, perm[parent[order]]
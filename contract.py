@@ -1,7 +1,9 @@
 """
 Building connected components using a tree representation.
 
-We contract paths when we look for roots. This can be proven to
+We contract paths when we look for roots. We do it by path splitting,
+where every node we pass on the way up is made to point to its
+grandparent, so we only need a single pass. This can be proven to
 have an amortised running time of O(log* n) so the whole
 algorithm runs in O(m log* n). The log* n (iterated logarithm)
 function grows incredibly slow and will never reach higher than
@@ -11,58 +13,51 @@ function grows incredibly slow and will never reach higher than
 is the inverse Ackermann function, which is even slower than log*
 but the proof is more involved and it hardly matters for anyone
 ever...)
-"""
-
-
-def is_size(v: int) -> bool:
-    """Check if v is size."""
-    return v < 0
-
 
-def is_node(v: int) -> bool:
-    """Check if v is a node."""
-    return v >= 0
-
-
-def size(v: int) -> int:
-    """Cast sizes to integers."""
-    assert is_size(v)
-    return -v
+When we merge two trees, we use Rem's algorithm and search for both
+roots at the same time, splicing the paths together as we go. A parent
+always has a larger index than its children, so the index plays the
+role of the rank and we don't need to store one. The bounds above
+are for balanced trees and this doesn't quite give us that, but it is
+one of the fastest variants in practice.
+"""
 
+from array import array
 
-def to_size(v: int) -> int:
-    """Cast integers to sizes."""
-    return -v
+Forest = array
 
 
-def root(f: list[int], v: int) -> int:
+def root(f: Forest, v: int) -> int:
     """Locate the root of v's forest."""
-    # Locate the root by running up the path
-    root = v
-    while is_node(f[root]):
-        root = f[root]
-
-    # Then contract the path to point to the root
-    while v != root:
-        v, f[v] = f[v], root
-
-    return root
-
-
-def union(f: list[int], v: int, w: int) -> None:
+    # After a few contractions most nodes are roots or children of
+    # roots, so check for that before we start on the path
+    parent = f[v]
+    if parent == v:
+        return v
+    if f[parent] == parent:
+        return parent
+
+    # Run up the path, pointing each node at its grandparent as we go
+    while parent != v:
+        f[v] = f[parent]
+        v, parent = parent, f[parent]
+    return v
+
+
+def union(f: Forest, v: int, w: int) -> None:
     """Merge v's and w's components and update comp accordingly."""
-    root_v, root_w = root(f, v), root(f, w)
-    size_w, size_v = size(f[root_w]), size(f[root_v])
-    new_size = to_size(size_w + size_v)
-
-    # make the larger tree the root
-    if size_w < size_v:
-        root_v, root_w = root_w, root_v
-    f[root_v] = root_w
-    f[root_w] = new_size
-
-
-def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
+    # Rem's algorithm: run up both paths at the same time, always moving
+    # the node with the smaller parent, and splice it onto the other path
+    while f[v] != f[w]:
+        if f[v] > f[w]:
+            v, w = w, v
+        if v == f[v]:
+            f[v] = f[w]
+            return
+        f[v], v = f[w], f[v]
+
+
+def components(n: int, edges: list[tuple[int, int]]) -> Forest:
     """
     Compute connected components.
 
@@ -76,7 +71,7 @@ def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
     >>> assert root(comp, 3) == root(comp, 4)
     >>> assert root(comp, 0) != root(comp, 3)
     """
-    components = [to_size(1) for i in range(n)]
+    components = array('i', range(n))
     for v, w in edges:
         assert 0 <= v < n and 0 <= w < n
         union(components, v, w)
@@ -1,32 +1,63 @@
 """
 Explore all cities we can reach from A.
+
+The neighbours are kept in compressed sparse row (CSR) form: the
+neighbours of v are indices[indptr[v]:indptr[v + 1]], so all the
+neighbour lists sit one after another in a single array. Each list is
+sorted and has no duplicates.
 """
 
+from collections import deque
+
+import numpy as np
+
 
 def build_neighbours(
     n: int,
     edges: list[tuple[int, int]]
-) -> list[set[int]]:
-    """Collect sets of neighbours for each node."""
-    neighbours: list[set[int]] = [set() for _ in range(n)]
-    for v, w in edges:
-        neighbours[v].add(w)
-        neighbours[w].add(v)
-    return neighbours
+) -> tuple[np.ndarray, np.ndarray]:
+    """Collect the neighbours for each node in CSR form."""
+    E = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    assert np.all((0 <= E) & (E < n))
+
+    # each edge goes both ways, and we sort the pairs by (v, w)
+    # so duplicates end up next to each other and can be dropped
+    src = np.concatenate((E[:, 0], E[:, 1]))
+    dst = np.concatenate((E[:, 1], E[:, 0]))
+    order = np.lexsort((dst, src))
+    src, dst = src[order], dst[order]
+    keep = np.ones(len(src), dtype=bool)
+    keep[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+    src, indices = src[keep], dst[keep]
 
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, indices
 
-def reachable(a: int, neighbors: list[set[int]]) -> set[int]:
+
+def reachable(a: int, indptr: np.ndarray, indices: np.ndarray) -> list[int]:
     """Collect all cities reachable from `a`."""
-    seen, unprocessed = {a}, {a}
+    # plain lists are faster to slice and iterate over than numpy arrays
+    indptr, indices = indptr.tolist(), indices.tolist()
+    seen = bytearray(len(indptr) - 1)
+    seen[a] = 1
+    unprocessed = deque((a,))
     while unprocessed:
-        v = unprocessed.pop()  # process the next city
-        for w in neighbors[v]:
-            if w not in seen:
-                seen.add(w)
-                unprocessed.add(w)
-    return seen
+        v = unprocessed.popleft()  # process the next city
+        for w in indices[indptr[v]:indptr[v + 1]]:
+            if not seen[w]:
+                seen[w] = 1
+                unprocessed.append(w)
+    return [v for v, s in enumerate(seen) if s]
+
+
+try:
+    # use the compiled version from _explore.pyx if it is built
+    from _explore import reachable  # noqa: F811
+except ImportError:
+    pass
 
 
-neighbours = build_neighbours(5, [(0, 1), (2, 1), (3, 4)])
-print(reachable(1, neighbours))
-print(reachable(3, neighbours))
+indptr, indices = build_neighbours(5, [(0, 1), (2, 1), (3, 4)])
+print(reachable(1, indptr, indices))
+print(reachable(3, indptr, indices))
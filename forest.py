@@ -6,25 +6,29 @@ and we do not balancing in this version, so we can still
 potentially run in O(nm).
 """
 
+from array import array
 
-def is_root(f: list[int], v: int) -> bool:
+
+def is_root(f: array, v: int) -> bool:
     """Return True if v is a root."""
     return f[v] == -1
 
 
-def root(f: list[int], v: int) -> int:
+def root(f: array, v: int) -> int:
     """Locate the root of v's forest."""
     while not is_root(f, v):
         v = f[v]
     return v
 
 
-def union(f: list[int], v: int, w: int) -> None:
+def union(f: array, v: int, w: int) -> None:
     """Merge v's and w's components and update comp accordingly."""
-    f[root(f, v)] = root(f, w)
+    root_v, root_w = root(f, v), root(f, w)
+    if root_v != root_w:
+        f[root_v] = root_w
 
 
-def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
+def components(n: int, edges: list[tuple[int, int]]) -> array:
     """
     Compute connected components.
 
@@ -38,7 +42,7 @@ def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
     >>> assert root(comp, 3) == root(comp, 4)
     >>> assert root(comp, 0) != root(comp, 3)
     """
-    components = [-1] * n
+    components = array('i', [-1]) * n
     for v, w in edges:
         assert 0 <= v < n and 0 <= w < n
         union(components, v, w)
@@ -0,0 +1,51 @@
+"""
+Building connected components by hooking and compressing.
+
+Instead of handling one edge at a time, we handle all of them at once
+with numpy operations, in the style of Shiloach and Vishkin. In each
+round we hook: for every edge whose end points have different
+parents, we point the larger parent at the smaller. Then we compress
+by pointer jumping, parent = parent[parent], until every node points
+directly at its root. We stop when both ends of all edges have the same
+root.
+
+A node's parent is never larger than the node itself, and parents only
+decrease, so the rounds must stop. On random graphs it takes
+O(log n) rounds, each of them O(n + m) vectorised work.
+"""
+
+import numpy as np
+
+
+def components(n: int, edges: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Compute connected components.
+
+    Compute the connected components for n nodes based on the
+    edges. All the nodes listed in the edges must be values in
+    the range 0 <= ... < n.
+
+    >>> comp = components(5, [(2, 1), (0, 1), (3, 4)])
+    >>> assert comp[0] == comp[1] and comp[1] == comp[2]
+    >>> assert comp[3] == comp[4]
+    >>> assert comp[0] != comp[3]
+    """
+    E = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    assert np.all((0 <= E) & (E < n))
+
+    parent = np.arange(n, dtype=np.int32)
+    while True:
+        # hook the larger parent of each edge onto the smaller
+        pv, pw = parent[E[:, 0]], parent[E[:, 1]]
+        differ = pv != pw
+        if not differ.any():
+            return parent
+        pv, pw = pv[differ], pw[differ]
+        np.minimum.at(parent, np.maximum(pv, pw), np.minimum(pv, pw))
+
+        # compress all paths so every node points at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
@@ -0,0 +1,60 @@
+"""
+Building connected components using a tree representation.
+
+Instead of balancing the trees by size or rank, we give each node a
+random priority when we start and always make the root with the lower
+priority a child of the one with the higher. This keeps the trees
+balanced in expectation, and since the priorities never change we
+don't have to read or update sizes when we merge trees. Together with
+path splitting, the expected running time is O(m a(n)) (Goel, Khanna,
+Larkin and Tarjan).
+"""
+
+import random
+from array import array
+
+Forest = array
+
+
+def root(f: Forest, v: int) -> int:
+    """Locate the root of v's forest."""
+    # Run up the path, pointing each node at its grandparent as we go
+    parent = f[v]
+    while parent != v:
+        f[v] = f[parent]
+        v, parent = parent, f[parent]
+    return v
+
+
+def union(f: Forest, priority: array, v: int, w: int) -> None:
+    """Merge v's and w's components and update comp accordingly."""
+    root_v, root_w = root(f, v), root(f, w)
+    if root_v == root_w:
+        return
+
+    # make the root with the higher priority the new root
+    if priority[root_w] < priority[root_v]:
+        root_v, root_w = root_w, root_v
+    f[root_v] = root_w
+
+
+def components(n: int, edges: list[tuple[int, int]]) -> Forest:
+    """
+    Compute connected components.
+
+    Compute the connected components for n nodes based on the
+    edges. All the nodes listed in the edges must be values in
+    the range 0 <= ... < n.
+
+    >>> comp = components(5, [(0, 1), (2, 1), (3, 4)])
+    >>> assert root(comp, 0) == root(comp, 1)
+    >>> assert root(comp, 1) == root(comp, 2)
+    >>> assert root(comp, 3) == root(comp, 4)
+    >>> assert root(comp, 0) != root(comp, 3)
+    """
+    priority = array('i', (random.getrandbits(31) for _ in range(n)))
+    components = array('i', range(n))
+    for v, w in edges:
+        assert 0 <= v < n and 0 <= w < n
+        union(components, priority, v, w)
+    return components
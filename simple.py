@@ -2,18 +2,21 @@
 Building connected components using simple union-find operations.
 
 Each update runs in O(n) so with O(m) edges the total running time is O(nm).
+The components are kept in a numpy array, so the O(n) relabelling is a
+single vectorised pass rather than a Python loop.
 """
 
+import numpy as np
 
-def union(comp: list[int], v: int, w: int) -> None:
+
+def union(comp: np.ndarray, v: int, w: int) -> None:
     """Merge v's and w's components and update comp accordingly."""
     cv, cw = comp[v], comp[w]
-    for u, cu in enumerate(comp):
-        if cu == cw:
-            comp[u] = cv
+    if cv != cw:
+        np.putmask(comp, comp == cw, cv)
 
 
-def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
+def components(n: int, edges: list[tuple[int, int]]) -> np.ndarray:
     """
     Compute connected components.
 
@@ -27,7 +30,7 @@ def components(n: int, edges: list[tuple[int, int]]) -> list[int]:
     >>> assert comp[0] != comp[3]
     """
     # Initially, each node has its own component
-    components = list(range(n))
+    components = np.arange(n, dtype=np.int32)
     for v, w in edges:
         assert 0 <= v < n and 0 <= w < n
         union(components, v, w)